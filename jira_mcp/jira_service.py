@@ -1,17 +1,73 @@
 """JIRA API service for fetching and analyzing tickets."""
 
+import asyncio
+import copy
 import os
-import base64
+import re
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 import httpx
 from dotenv import load_dotenv
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json
+
+    _json_loads = json.loads
+
 load_dotenv()
 
+# Acceptance criteria patterns. The description is split into blank-line
+# separated blocks first so no pattern needs a lazy bridge to find the end
+# of a section, which keeps matching linear on long descriptions.
+_BLOCK_SPLIT_RE = re.compile(r"\n[ \t\r]*\n")
+_AC_HEADER_RE = re.compile(
+    r"(?:acceptance criteria|^AC)\b:?\s*(.*)", re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+_GWT_LINE_RE = re.compile(r"(?:given|when|then)[:\s]+(.*)", re.IGNORECASE)
+
+# Maximum number of tickets kept in the in-memory ticket cache
+_TICKET_CACHE_SIZE = 128
+
+# Retries for rate-limited (HTTP 429) requests, and the longest we wait
+_MAX_RETRIES = 3
+_MAX_RETRY_DELAY = 30.0
+
+# Seconds to wait for the best-effort warm-up request before giving up
+_WARM_UP_TIMEOUT = 5.0
+
+# Pulls the errorMessages array out of a JIRA error body without decoding it all
+_ERR_RE = re.compile(rb'"errorMessages"\s*:\s*(\[[^\]]*\])')
+
+
+def _error_messages(content: bytes) -> list[str]:
+    """Extract JIRA's errorMessages list from an error response body."""
+    match = _ERR_RE.search(content)
+    if match:
+        try:
+            return _json_loads(match.group(1))
+        except ValueError:
+            pass
+    try:
+        return _json_loads(content).get("errorMessages", [])
+    except (ValueError, AttributeError):
+        return []
+
 
 class JiraService:
     """Service for interacting with JIRA API."""
 
+    # Fields requested for a single ticket unless the caller asks otherwise
+    _DEFAULT_FIELDS = (
+        "summary,description,status,issuetype,priority,assignee,created,labels,components"
+    )
+    # Every field, including custom fields such as acceptance criteria
+    ALL_FIELDS = "*all"
+
     def __init__(self):
         self.base_url = os.getenv("JIRA_BASE_URL", "")
         email = os.getenv("JIRA_EMAIL", "")
@@ -22,84 +78,230 @@ class JiraService:
                 "JIRA configuration missing. Set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN"
             )
 
-        # Create base64 encoded auth
-        auth_string = f"{email}:{api_token}"
-        auth_bytes = base64.b64encode(auth_string.encode()).decode()
-
+        self._auth = httpx.BasicAuth(email, api_token)
         self.headers = {
-            "Authorization": f"Basic {auth_bytes}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # TTL cache for get_ticket_with_discussions, keyed by (ticket ID, fields)
+        self._ticket_cache: OrderedDict[
+            tuple[str, str], tuple[float, dict[str, Any]]
+        ] = OrderedDict()
+        self._ttl = float(os.getenv("JIRA_CACHE_TTL", "300"))
+
+        # Caps in-flight requests across all methods to stay under rate limits
+        self._gate = asyncio.Semaphore(
+            max(1, int(os.getenv("JIRA_MAX_CONCURRENCY", "8")))
+        )
 
-    async def fetch_ticket(self, ticket_id: str) -> dict[str, Any]:
-        """Fetch a single JIRA ticket by ID or key."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/rest/api/3/issue/{ticket_id}",
-                    headers=self.headers,
-                    params={"expand": "renderedFields"},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                error_msg = e.response.json().get("errorMessages", [])
-                raise ValueError(f"Failed to fetch ticket {ticket_id}: {error_msg}")
-            except Exception as e:
-                raise ValueError(f"Error fetching ticket: {str(e)}")
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                auth=self._auth,
+                headers=self.headers,
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=40,
+                    keepalive_expiry=60.0,
+                ),
+                http2=True,
+            )
+        return self._client
+
+    async def warm_up(self) -> None:
+        """Open the pooled connection ahead of the first tool call."""
+        client = await self._get_client()
+        try:
+            await client.get("/rest/api/3/myself", timeout=_WARM_UP_TIMEOUT)
+        except httpx.HTTPError:
+            # Warm-up is best effort; real calls report their own errors
+            pass
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the concurrency gate, retrying on HTTP 429."""
+        client = await self._get_client()
+        for attempt in range(_MAX_RETRIES + 1):
+            async with self._gate:
+                response = await client.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt == _MAX_RETRIES:
+                return response
+            # Back off outside the gate so other requests can proceed
+            await asyncio.sleep(self._retry_delay(response, attempt))
+        return response
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, honouring Retry-After when given."""
+        try:
+            delay = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            delay = 2.0**attempt
+        return min(max(delay, 0.0), _MAX_RETRY_DELAY)
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        # Detach first so callers arriving during aclose() get a fresh client
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "JiraService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def fetch_ticket(
+        self,
+        ticket_id: str,
+        *,
+        fields: Optional[str] = None,
+        expand_rendered: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch a single JIRA ticket by ID or key.
+
+        Only ``fields`` (default: ``_DEFAULT_FIELDS``) are requested, and the
+        rendered HTML copy of each field is included only when
+        ``expand_rendered`` is set.
+        """
+        params = {"fields": fields or self._DEFAULT_FIELDS}
+        if expand_rendered:
+            params["expand"] = "renderedFields"
+
+        try:
+            response = await self._request(
+                "GET", f"/rest/api/3/issue/{ticket_id}", params=params
+            )
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except httpx.HTTPStatusError as e:
+            error_msg = _error_messages(e.response.content)
+            raise ValueError(f"Failed to fetch ticket {ticket_id}: {error_msg}")
+        except Exception as e:
+            raise ValueError(f"Error fetching ticket: {str(e)}")
 
     async def search_tickets(self, jql: str, max_results: int = 10) -> dict[str, Any]:
         """Search JIRA tickets using JQL."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/rest/api/3/search",
-                    headers=self.headers,
-                    params={
-                        "jql": jql,
-                        "maxResults": max_results,
-                        "fields": "summary,status,issuetype,priority,assignee,created",
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                raise ValueError(f"Failed to search tickets: {str(e)}")
+        try:
+            response = await self._request(
+                "GET",
+                "/rest/api/3/search",
+                params={
+                    "jql": jql,
+                    "maxResults": max_results,
+                    "fields": "summary,status,issuetype,priority,assignee,created",
+                },
+            )
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except httpx.HTTPStatusError as e:
+            error_msg = _error_messages(e.response.content)
+            raise ValueError(f"Failed to search tickets: {error_msg}")
+        except Exception as e:
+            raise ValueError(f"Failed to search tickets: {str(e)}")
+
+    async def search_tickets_with_details(
+        self, jql: str, max_results: int = 10, concurrency: int = 5
+    ) -> dict[str, Any]:
+        """Search JIRA tickets using JQL and fetch full details for each hit."""
+        results = await self.search_tickets(jql, max_results)
+        keys = [issue["key"] for issue in results.get("issues", [])]
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch_one(key: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.fetch_ticket(key, fields=self.ALL_FIELDS)
+
+        details = await asyncio.gather(
+            *(fetch_one(key) for key in keys), return_exceptions=True
+        )
+
+        issues = []
+        errors = []
+        for key, detail in zip(keys, details):
+            if isinstance(detail, Exception):
+                errors.append({"key": key, "error": str(detail)})
+            else:
+                issues.append(detail)
+
+        return {
+            "total": results.get("total", len(keys)),
+            "issues": issues,
+            "errors": errors,
+        }
 
     async def get_ticket_comments(self, ticket_id: str) -> list[dict[str, Any]]:
         """Get comments for a ticket."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/rest/api/3/issue/{ticket_id}/comment",
-                    headers=self.headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data.get("comments", [])
-            except Exception as e:
-                raise ValueError(f"Failed to fetch comments: {str(e)}")
-
-    async def get_ticket_with_discussions(self, ticket_id: str) -> dict[str, Any]:
-        """Fetch a ticket along with its discussions/comments."""
-        # Fetch the main ticket
-        ticket = await self.fetch_ticket(ticket_id)
-        
-        # Fetch comments/discussions
         try:
-            comments = await self.get_ticket_comments(ticket_id)
-            ticket["discussions"] = comments
-            ticket["discussion_summary"] = self._summarize_discussions(comments)
+            response = await self._request("GET", f"/rest/api/3/issue/{ticket_id}/comment")
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            return data.get("comments", [])
+        except httpx.HTTPStatusError as e:
+            error_msg = _error_messages(e.response.content)
+            raise ValueError(f"Failed to fetch comments for {ticket_id}: {error_msg}")
         except Exception as e:
-            # If fetching comments fails, continue with empty discussions
+            raise ValueError(f"Failed to fetch comments: {str(e)}")
+
+    async def get_ticket_with_discussions(
+        self, ticket_id: str, *, fields: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Fetch a ticket along with its discussions/comments.
+
+        Only ``fields`` (default: ``_DEFAULT_FIELDS``) are requested. Results
+        are cached for ``JIRA_CACHE_TTL`` seconds so that chaining several
+        tools on the same ticket only hits JIRA once. A ticket whose comments
+        could not be fetched is returned but not cached.
+        """
+        fields = fields or self._DEFAULT_FIELDS
+        key = (ticket_id, fields)
+        now = time.monotonic()
+        hit = self._ticket_cache.get(key)
+        if hit is not None and now - hit[0] < self._ttl:
+            self._ticket_cache.move_to_end(key)
+            return copy.deepcopy(hit[1])
+
+        # Fetch the main ticket and its comments/discussions concurrently
+        ticket, comments = await asyncio.gather(
+            self.fetch_ticket(ticket_id, fields=fields),
+            self.get_ticket_comments(ticket_id),
+            return_exceptions=True,
+        )
+        if isinstance(ticket, BaseException):
+            raise ticket
+
+        if isinstance(comments, Exception):
+            # If fetching comments fails, continue with empty discussions, but
+            # don't cache the degraded ticket so the next call retries them
             ticket["discussions"] = []
             ticket["discussion_summary"] = ""
-            
+            return ticket
+
+        ticket["discussions"] = comments
+        ticket["discussion_summary"] = self._summarize_discussions(comments)
+
+        if self._ttl > 0:
+            self._ticket_cache[key] = (now, ticket)
+            self._ticket_cache.move_to_end(key)
+            while len(self._ticket_cache) > _TICKET_CACHE_SIZE:
+                self._ticket_cache.popitem(last=False)
+            return copy.deepcopy(ticket)
+
         return ticket
+
+    def invalidate(self, ticket_id: Optional[str] = None) -> None:
+        """Drop a ticket from the cache, or clear the whole cache."""
+        if ticket_id is None:
+            self._ticket_cache.clear()
+        else:
+            for key in [key for key in self._ticket_cache if key[0] == ticket_id]:
+                del self._ticket_cache[key]
     
     def _summarize_discussions(self, comments: list[dict[str, Any]]) -> str:
         """Extract and summarize key information from discussions."""
@@ -124,42 +326,47 @@ class JiraService:
     
     def _extract_text_from_adf(self, adf_content: dict) -> str:
         """Extract text from JIRA's Atlassian Document Format."""
-        text_parts = []
-        
-        def extract_from_node(node: dict):
-            if isinstance(node, dict):
-                # Check if node has text
-                if "text" in node:
-                    text_parts.append(node["text"])
-                
-                # Process content array
-                if "content" in node and isinstance(node["content"], list):
-                    for child in node["content"]:
-                        extract_from_node(child)
-        
-        extract_from_node(adf_content)
+        text_parts: list[str] = []
+        append = text_parts.append
+
+        # Walk the tree with an explicit stack; children are pushed in
+        # reverse so they are popped in document order.
+        stack: list[Any] = [adf_content]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            if not isinstance(node, dict):
+                continue
+            text = node.get("text")
+            if text is not None:
+                append(text)
+            children = node.get("content")
+            if isinstance(children, list):
+                extend(reversed(children))
+
         return " ".join(text_parts)
 
     def extract_acceptance_criteria(self, description: str) -> list[str]:
         """Extract acceptance criteria from ticket description."""
-        import re
-
-        criteria = []
-
-        # Patterns for acceptance criteria
-        patterns = [
-            r"acceptance criteria:?\s*([\s\S]*?)(?=\n\n|$)",
-            r"^AC:?\s*([\s\S]*?)(?=\n\n|$)",
-            r"^given[:\s]+(.*?)$",
-            r"^when[:\s]+(.*?)$",
-            r"^then[:\s]+(.*?)$",
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, description, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                text = match.group(1) if match.lastindex else match.group(0)
-                lines = [line.strip() for line in text.split("\n") if line.strip()]
-                criteria.extend(lines)
-
-        return list(set(criteria))  # Remove duplicates
+        criteria: list[str] = []
+        seen: set[str] = set()
+
+        for block in _BLOCK_SPLIT_RE.split(description):
+            match = _AC_HEADER_RE.search(block)
+            if match:
+                for line in match.group(1).split("\n"):
+                    line = line.strip()
+                    if line and line not in seen:
+                        seen.add(line)
+                        criteria.append(line)
+
+        for line in description.splitlines():
+            match = _GWT_LINE_RE.match(line)
+            if match:
+                text = match.group(1).strip()
+                if text and text not in seen:
+                    seen.add(text)
+                    criteria.append(text)
+
+        return criteria
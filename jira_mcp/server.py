@@ -1,15 +1,48 @@
 """JIRA Test Automation MCP Server using FastMCP."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
 from .jira_service import JiraService
 from .test_generator import TestGeneratorService
 
-# Initialize FastMCP server
-mcp = FastMCP("JIRA Test Automation")
-
 # Initialize services
-jira_service = JiraService()
 test_generator = TestGeneratorService()
+_jira_service: JiraService | None = None
+
+
+def get_jira() -> JiraService:
+    """Return the shared JIRA service, creating it on first use."""
+    global _jira_service
+    if _jira_service is None:
+        _jira_service = JiraService()
+    return _jira_service
+
+
+# Server lifespans currently running. FastMCP may enter the lifespan once per
+# session, so the shared JIRA client is only released when the last one ends.
+_active_lifespans = 0
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm up the JIRA connection on startup and release it on shutdown."""
+    global _active_lifespans
+    jira_service = get_jira()
+    _active_lifespans += 1
+    try:
+        if _active_lifespans == 1:
+            await jira_service.warm_up()
+        yield
+    finally:
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            await jira_service.close()
+
+
+# Initialize FastMCP server
+mcp = FastMCP("JIRA Test Automation", lifespan=lifespan)
 
 
 @mcp.tool()
@@ -23,7 +56,9 @@ async def fetch_jira_ticket(ticket_id: str) -> dict:
     Returns:
         Complete ticket information including description, acceptance criteria, discussions, and metadata
     """
-    return await jira_service.get_ticket_with_discussions(ticket_id)
+    return await get_jira().get_ticket_with_discussions(
+        ticket_id, fields=JiraService.ALL_FIELDS
+    )
 
 
 @mcp.tool()
@@ -37,7 +72,7 @@ async def analyze_ticket_requirements(ticket_id: str) -> dict:
     Returns:
         Analysis containing test scenarios, estimated test count, and complexity
     """
-    ticket = await jira_service.get_ticket_with_discussions(ticket_id)
+    ticket = await get_jira().get_ticket_with_discussions(ticket_id)
     return await test_generator.analyze_requirements(ticket)
 
 
@@ -58,7 +93,7 @@ async def generate_test_scripts(
     Returns:
         Result containing list of generated files and success message
     """
-    ticket = await jira_service.get_ticket_with_discussions(ticket_id)
+    ticket = await get_jira().get_ticket_with_discussions(ticket_id)
     
     if language not in ["java", "python"]:
         return {
@@ -81,7 +116,25 @@ async def search_jira_tickets(jql: str, max_results: int = 10) -> dict:
     Returns:
         Search results with matching tickets
     """
-    return await jira_service.search_tickets(jql, max_results)
+    return await get_jira().search_tickets(jql, max_results)
+
+
+@mcp.tool()
+async def search_jira_tickets_with_details(
+    jql: str, max_results: int = 10, concurrency: int = 5
+) -> dict:
+    """
+    Search JIRA tickets using JQL and fetch full details for every match.
+    
+    Args:
+        jql: JQL query string (e.g., "project = PROJ AND status = Open")
+        max_results: Maximum number of results to return
+        concurrency: Maximum number of ticket details fetched in parallel
+    
+    Returns:
+        Full ticket details for each match, plus any per-ticket fetch errors
+    """
+    return await get_jira().search_tickets_with_details(jql, max_results, concurrency)
 
 
 @mcp.tool()
@@ -99,7 +152,7 @@ async def generate_gherkin_features(
     Returns:
         Generated feature file path and content
     """
-    ticket = await jira_service.get_ticket_with_discussions(ticket_id)
+    ticket = await get_jira().get_ticket_with_discussions(ticket_id)
     return await test_generator.generate_gherkin_features(ticket, output_path)
 
 
@@ -120,7 +173,7 @@ async def generate_manual_test_plans(
     Returns:
         Result containing list of generated test plan files
     """
-    ticket = await jira_service.get_ticket_with_discussions(ticket_id)
+    ticket = await get_jira().get_ticket_with_discussions(ticket_id)
     analysis = await test_generator.analyze_requirements(ticket)
     
     from pathlib import Path
@@ -1,267 +1,58 @@
 """Test automation script generator for Selenium + TestNG + Cucumber."""
 
+import asyncio
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Literal
-
-
-class TestScenario:
-    """Represents a test scenario with Given-When-Then steps."""
-
-    def __init__(
-        self,
-        scenario: str,
-        given: list[str],
-        when: list[str],
-        then: list[str],
-    ):
-        self.scenario = scenario
-        self.given = given
-        self.when = when
-        self.then = then
-
-
-class TestGeneratorService:
-    """Service for generating test automation scripts."""
-
-    def __init__(self):
-        self.output_dir = os.getenv("OUTPUT_DIRECTORY", "./generated-tests")
-
-    async def analyze_requirements(self, ticket: dict[str, Any]) -> dict[str, Any]:
-        """Analyze ticket requirements and extract test scenarios."""
-        fields = ticket.get("fields", {})
-        description = fields.get("description", "")
-        summary = fields.get("summary", "")
-        discussion_summary = ticket.get("discussion_summary", "")
-
-        scenarios = self._extract_test_scenarios(description, summary, discussion_summary)
-        complexity = self._calculate_complexity(scenarios, description)
-
-        return {
-            "ticket_key": ticket["key"],
-            "summary": summary,
-            "discussion_summary": discussion_summary,
-            "test_scenarios": [
-                {
-                    "scenario": s.scenario,
-                    "given": s.given,
-                    "when": s.when,
-                    "then": s.then,
-                }
-                for s in scenarios
-            ],
-            "estimated_test_count": len(scenarios),
-            "complexity": complexity,
-        }
-
-    async def generate_tests(
-        self,
-        ticket: dict[str, Any],
-        language: Literal["java", "python"] = "java",
-        output_path: str | None = None,
-    ) -> dict[str, Any]:
-        """Generate complete test automation suite."""
-        analysis = await self.analyze_requirements(ticket)
-        ticket_key = ticket["key"]
-        output_directory = Path(output_path or self.output_dir) / ticket_key
-        output_directory.mkdir(parents=True, exist_ok=True)
-
-        generated_files = []
-
-        # Generate Gherkin feature file
-        feature_content = self._generate_feature_file(analysis)
-        feature_path = output_directory / f"{ticket_key}.feature"
-        feature_path.write_text(feature_content, encoding="utf-8")
-        generated_files.append(str(feature_path))
-
-        # Generate language-specific files
-        if language == "java":
-            java_files = self._generate_java_tests(analysis, output_directory)
-            generated_files.extend(java_files)
-        else:
-            python_files = self._generate_python_tests(analysis, output_directory)
-            generated_files.extend(python_files)
-
-        # Generate TestNG XML
-        testng_content = self._generate_testng_xml(analysis)
-        testng_path = output_directory / "testng.xml"
-        testng_path.write_text(testng_content, encoding="utf-8")
-        generated_files.append(str(testng_path))
-
-        # Generate README
-        readme_content = self._generate_readme(analysis, language)
-        readme_path = output_directory / "README.md"
-        readme_path.write_text(readme_content, encoding="utf-8")
-        generated_files.append(str(readme_path))
-
-        # Generate manual test plans
-        manual_test_files = self._generate_manual_test_plans(
-            ticket, analysis, output_directory
-        )
-        generated_files.extend(manual_test_files)
-
-        return {
-            "success": True,
-            "files": generated_files,
-            "message": f"Generated {len(generated_files)} files for {ticket_key}",
-        }
-
-    async def generate_gherkin_features(
-        self, ticket: dict[str, Any], output_path: str | None = None
-    ) -> dict[str, Any]:
-        """Generate Gherkin feature files only."""
-        analysis = await self.analyze_requirements(ticket)
-        feature_content = self._generate_feature_file(analysis)
-        ticket_key = ticket["key"]
-
-        if output_path:
-            feature_path = Path(output_path) / f"{ticket_key}.feature"
-            feature_path.parent.mkdir(parents=True, exist_ok=True)
-            feature_path.write_text(feature_content, encoding="utf-8")
-            return {
-                "success": True,
-                "file": str(feature_path),
-                "content": feature_content,
-            }
-
-        return {
-            "success": True,
-            "file": f"{ticket_key}.feature",
-            "content": feature_content,
-        }
-
-    def _extract_test_scenarios(
-        self, description: str, summary: str, discussion_summary: str = ""
-    ) -> list[TestScenario]:
-        """Extract test scenarios from description and discussions."""
-        scenarios = []
-        
-        # Combine description and discussion for comprehensive analysis
-        combined_text = f"{description}\n\n{discussion_summary}"
-
-        # Pattern: Given-When-Then format
-        gwt_pattern = re.compile(
-            r"given\s+(.*?)(?:\n|$).*?when\s+(.*?)(?:\n|$).*?then\s+(.*?)(?:\n|$)",
-            re.IGNORECASE | re.DOTALL,
-        )
-
-        for match in gwt_pattern.finditer(combined_text):
-            scenarios.append(
-                TestScenario(
-                    scenario=f"Scenario: {summary}",
-                    given=[match.group(1).strip()],
-                    when=[match.group(2).strip()],
-                    then=[match.group(3).strip()],
-                )
-            )
-
-        # Extract additional scenarios from discussions
-        if discussion_summary:
-            discussion_scenarios = self._extract_scenarios_from_discussions(discussion_summary, summary)
-            scenarios.extend(discussion_scenarios)
-
-        # Fallback: Create basic scenario
-        if not scenarios:
-            scenarios.append(
-                TestScenario(
-                    scenario=f"Test {summary}",
-                    given=["User is on the application"],
-                    when=["User performs the action described in ticket"],
-                    then=["Expected behavior occurs as per ticket description"],
-                )
-            )
-
-        return scenarios
-    
-    def _extract_scenarios_from_discussions(
-        self, discussion_summary: str, summary: str
-    ) -> list[TestScenario]:
-        """Extract additional test scenarios from discussion comments."""
-        scenarios = []
-        
-        # Look for test-related keywords in discussions
-        test_keywords = [
-            r"test\s+case[s]?:?\s*(.*?)(?:\n\n|$)",
-            r"scenario[s]?:?\s*(.*?)(?:\n\n|$)",
-            r"edge\s+case[s]?:?\s*(.*?)(?:\n\n|$)",
-            r"acceptance\s+criteria:?\s*(.*?)(?:\n\n|$)",
-            r"should\s+(.*?)(?:\n|$)",
-            r"verify\s+(.*?)(?:\n|$)",
-            r"ensure\s+(.*?)(?:\n|$)",
-        ]
-        
-        for pattern in test_keywords:
-            matches = re.finditer(pattern, discussion_summary, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                scenario_text = match.group(1).strip()
-                if scenario_text and len(scenario_text) > 10:
-                    # Create a scenario from the discussion point
-                    scenarios.append(
-                        TestScenario(
-                            scenario=f"Scenario from discussion: {scenario_text[:100]}",
-                            given=["User is on the application"],
-                            when=[f"User performs: {scenario_text[:150]}"],
-                            then=["Expected behavior should match the discussion requirement"],
-                        )
-                    )
-        
-        return scenarios
-
-    def _calculate_complexity(
-        self, scenarios: list[TestScenario], description: str
-    ) -> Literal["low", "medium", "high"]:
-        """Calculate test complexity."""
-        scenario_count = len(scenarios)
-        desc_length = len(description)
-
-        if scenario_count <= 2 and desc_length < 500:
-            return "low"
-        if scenario_count <= 5 and desc_length < 1500:
-            return "medium"
-        return "high"
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Literal, Mapping
+
+# Separator lines used throughout the manual test plans
+_EQ80 = "=" * 80
+_DASH80 = "─" * 80
+
+# Given-When-Then keywords, each followed by its step text on the same line
+_GWT_KEYWORDS = ("given", "when", "then")
+_GWT_KEYWORD_RES = tuple(
+    re.compile(rf"{keyword}[^\S\n]+", re.IGNORECASE) for keyword in _GWT_KEYWORDS
+)
 
-    def _generate_feature_file(self, analysis: dict[str, Any]) -> str:
-        """Generate Gherkin feature file content."""
-        lines = [
-            f"Feature: {analysis['summary']}",
-            "  As a tester",
-            f"  I want to test {analysis['ticket_key']}",
-            "  So that the functionality works as expected",
-            "",
-        ]
-        
-        # Add discussion context if available
-        if analysis.get("discussion_summary"):
-            lines.append("  # Additional context from discussions:")
-            discussion_lines = analysis["discussion_summary"].split("\n\n")
-            for disc_line in discussion_lines[:3]:  # Limit to first 3 discussion points
-                if disc_line.strip():
-                    lines.append(f"  # {disc_line.strip()[:100]}")
-            lines.append("")
+# Test-related keywords looked for in discussions. Each pattern is scanned
+# separately so matches of different keywords may overlap.
+_DISCUSSION_RES = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"test\s+case[s]?:?\s*(.*?)(?:\n\n|$)",
+        r"scenario[s]?:?\s*(.*?)(?:\n\n|$)",
+        r"edge\s+case[s]?:?\s*(.*?)(?:\n\n|$)",
+        r"acceptance\s+criteria:?\s*(.*?)(?:\n\n|$)",
+        r"should\s+(.*?)(?:\n|$)",
+        r"verify\s+(.*?)(?:\n|$)",
+        r"ensure\s+(.*?)(?:\n|$)",
+    )
+)
+# Non-ASCII letters that re.IGNORECASE treats as equal to an ASCII letter and
+# that str.lower() does not map to it (KELVIN SIGN already lowers to "k")
+_IGNORECASE_ALIASES = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"))
 
-        for i, scenario in enumerate(analysis["test_scenarios"]):
-            lines.append(f"  Scenario: {scenario['scenario']}")
-            for step in scenario["given"]:
-                lines.append(f"    Given {step}")
-            for step in scenario["when"]:
-                lines.append(f"    When {step}")
-            for step in scenario["then"]:
-                lines.append(f"    Then {step}")
-            if i < len(analysis["test_scenarios"]) - 1:
-                lines.append("")
+# Literal words at least one of which must appear for _DISCUSSION_RES to match
+_DISCUSSION_LITERALS = (
+    "test", "scenario", "edge", "acceptance", "should", "verify", "ensure"
+)
 
-        return "\n".join(lines)
+# Steps used by default and by every discussion-derived scenario. Kept as
+# tuples and copied into each scenario, so callers can never alter them.
+_DEFAULT_GIVEN = ("User is on the application",)
+_DISCUSSION_THEN = ("Expected behavior should match the discussion requirement",)
 
-    def _generate_java_tests(
-        self, analysis: dict[str, Any], output_dir: Path
-    ) -> list[str]:
-        """Generate Java test files."""
-        files = []
-        class_name = analysis["ticket_key"].replace("-", "_")
 
-        # Step definitions
-        step_defs = f'''package stepdefinitions;
+# Templates for generated files, filled with str.format_map
+_JAVA_STEP_DEFS_TEMPLATE = '''package stepdefinitions;
 
 import io.cucumber.java.en.*;
 import io.cucumber.java.After;
@@ -300,18 +91,14 @@ public class {class_name}StepDefinitions {{
     }}
 }}
 '''
-        step_path = output_dir / "StepDefinitions.java"
-        step_path.write_text(step_defs, encoding="utf-8")
-        files.append(str(step_path))
 
-        # Test runner
-        runner = f'''package runners;
+_JAVA_TEST_RUNNER_TEMPLATE = '''package runners;
 
 import io.cucumber.testng.AbstractTestNGCucumberTests;
 import io.cucumber.testng.CucumberOptions;
 
 @CucumberOptions(
-    features = "src/test/resources/features/{analysis["ticket_key"]}.feature",
+    features = "src/test/resources/features/{ticket_key}.feature",
     glue = {{"stepdefinitions"}},
     plugin = {{
         "pretty",
@@ -323,12 +110,8 @@ import io.cucumber.testng.CucumberOptions;
 public class {class_name}TestRunner extends AbstractTestNGCucumberTests {{
 }}
 '''
-        runner_path = output_dir / "TestRunner.java"
-        runner_path.write_text(runner, encoding="utf-8")
-        files.append(str(runner_path))
 
-        # POM XML
-        pom = f'''<?xml version="1.0" encoding="UTF-8"?>
+_POM_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
 <project xmlns="http://maven.apache.org/POM/4.0.0"
          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
          xsi:schemaLocation="http://maven.apache.org/POM/4.0.0
@@ -336,7 +119,7 @@ public class {class_name}TestRunner extends AbstractTestNGCucumberTests {{
     <modelVersion>4.0.0</modelVersion>
 
     <groupId>com.testautomation</groupId>
-    <artifactId>{analysis["ticket_key"].lower()}</artifactId>
+    <artifactId>{artifact_id}</artifactId>
     <version>1.0-SNAPSHOT</version>
 
     <properties>
@@ -371,20 +154,8 @@ public class {class_name}TestRunner extends AbstractTestNGCucumberTests {{
     </dependencies>
 </project>
 '''
-        pom_path = output_dir / "pom.xml"
-        pom_path.write_text(pom, encoding="utf-8")
-        files.append(str(pom_path))
-
-        return files
-
-    def _generate_python_tests(
-        self, analysis: dict[str, Any], output_dir: Path
-    ) -> list[str]:
-        """Generate Python test files."""
-        files = []
 
-        # Step definitions
-        step_defs = '''from behave import given, when, then
+_PYTHON_STEP_DEFS = '''from behave import given, when, then
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
@@ -410,30 +181,18 @@ def after_scenario(context, scenario):
     if hasattr(context, 'driver'):
         context.driver.quit()
 '''
-        step_path = output_dir / "step_definitions.py"
-        step_path.write_text(step_defs, encoding="utf-8")
-        files.append(str(step_path))
 
-        # Requirements
-        requirements = '''selenium==4.15.0
+_PYTHON_REQUIREMENTS = '''selenium==4.15.0
 behave==1.2.6
 webdriver-manager==4.0.1
 pytest==7.4.3
 allure-behave==2.13.2
 '''
-        req_path = output_dir / "requirements.txt"
-        req_path.write_text(requirements, encoding="utf-8")
-        files.append(str(req_path))
-
-        return files
 
-    def _generate_testng_xml(self, analysis: dict[str, Any]) -> str:
-        """Generate TestNG XML configuration."""
-        class_name = analysis["ticket_key"].replace("-", "_")
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
+_TESTNG_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE suite SYSTEM "http://testng.org/testng-1.0.dtd">
-<suite name="{analysis["ticket_key"]} Test Suite" parallel="false">
-    <test name="{analysis["ticket_key"]} Tests">
+<suite name="{ticket_key} Test Suite" parallel="false">
+    <test name="{ticket_key} Tests">
         <classes>
             <class name="runners.{class_name}TestRunner"/>
         </classes>
@@ -441,42 +200,21 @@ allure-behave==2.13.2
 </suite>
 '''
 
-    def _generate_readme(self, analysis: dict[str, Any], language: str) -> str:
-        """Generate README documentation."""
-        scenarios_text = "\n\n".join(
-            f'''### {i+1}. {s["scenario"]}
-- **Given**: {", ".join(s["given"])}
-- **When**: {", ".join(s["when"])}
-- **Then**: {", ".join(s["then"])}'''
-            for i, s in enumerate(analysis["test_scenarios"])
-        )
-
-        setup_instructions = (
-            """1. Install Java JDK 11 or higher
-2. Install Maven
-3. Run: `mvn clean install`
-4. Execute tests: `mvn test`"""
-            if language == "java"
-            else """1. Install Python 3.8 or higher
-2. Install dependencies: `pip install -r requirements.txt`
-3. Run tests: `behave`"""
-        )
-
-        return f'''# Test Automation for {analysis["ticket_key"]}
+_README_TEMPLATE = '''# Test Automation for {ticket_key}
 
 ## Summary
-{analysis["summary"]}
+{summary}
 
 ## Test Information
-- **Ticket**: {analysis["ticket_key"]}
-- **Estimated Test Count**: {analysis["estimated_test_count"]}
-- **Complexity**: {analysis["complexity"]}
+- **Ticket**: {ticket_key}
+- **Estimated Test Count**: {estimated_test_count}
+- **Complexity**: {complexity}
 - **Language**: {language}
 - **Framework**: Selenium + TestNG + Cucumber
 
 ## Setup Instructions
 
-### {language.title()} Setup
+### {language_title} Setup
 
 {setup_instructions}
 
@@ -499,232 +237,110 @@ allure-behave==2.13.2
 5. Run tests and review results
 
 ## Notes
-- Auto-generated test suite based on JIRA ticket {analysis["ticket_key"]}
+- Auto-generated test suite based on JIRA ticket {ticket_key}
 - Review and enhance test logic as needed
 - Add assertions specific to your application
 - Integrate with CI/CD pipeline
 '''
 
-    def _generate_manual_test_plans(
-        self, ticket: dict[str, Any], analysis: dict[str, Any], output_dir: Path
-    ) -> list[str]:
-        """Generate detailed manual test plan files with 100% coverage."""
-        generated_files = []
-        ticket_key = analysis["ticket_key"]
-        fields = ticket.get("fields", {})
-        
-        # Extract all relevant information
-        description = fields.get("description", "")
-        summary = analysis.get("summary", "")
-        discussion_summary = analysis.get("discussion_summary", "")
-        test_scenarios = analysis.get("test_scenarios", [])
-        
-        # Generate test plans for each scenario
-        for idx, scenario in enumerate(test_scenarios, start=1):
-            test_plan_content = self._create_manual_test_plan(
-                ticket_key=ticket_key,
-                test_number=idx,
-                scenario=scenario,
-                summary=summary,
-                description=description,
-                discussion_summary=discussion_summary,
-                total_tests=len(test_scenarios)
-            )
-            
-            # Create filename: <JIRA_ID>_Test<number>.txt
-            filename = f"{ticket_key}_Test{idx}.txt"
-            file_path = output_dir / filename
-            file_path.write_text(test_plan_content, encoding="utf-8")
-            generated_files.append(str(file_path))
-        
-        # Generate additional edge case and negative test plans
-        additional_tests = self._generate_additional_test_cases(
-            ticket_key=ticket_key,
-            description=description,
-            discussion_summary=discussion_summary,
-            starting_index=len(test_scenarios) + 1
-        )
-        
-        for idx, test_content in enumerate(additional_tests, start=len(test_scenarios) + 1):
-            filename = f"{ticket_key}_Test{idx}.txt"
-            file_path = output_dir / filename
-            file_path.write_text(test_content, encoding="utf-8")
-            generated_files.append(str(file_path))
-        
-        return generated_files
-    
-    def _create_manual_test_plan(
-        self,
-        ticket_key: str,
-        test_number: int,
-        scenario: dict[str, Any],
-        summary: str,
-        description: str,
-        discussion_summary: str,
-        total_tests: int
-    ) -> str:
-        """Create a detailed manual test plan document."""
-        
-        # Extract scenario details
-        scenario_name = scenario.get("scenario", "Test Scenario")
-        given_steps = scenario.get("given", [])
-        when_steps = scenario.get("when", [])
-        then_steps = scenario.get("then", [])
-        
-        # Build test steps
-        test_steps = []
-        step_number = 1
-        
-        # Preconditions from Given
-        for given in given_steps:
-            test_steps.append({
-                "step_num": step_number,
-                "action": f"Verify precondition: {given}",
-                "expected": "Precondition is met and ready for testing",
-                "type": "Precondition"
-            })
-            step_number += 1
-        
-        # Actions from When
-        for when in when_steps:
-            test_steps.append({
-                "step_num": step_number,
-                "action": self._expand_action_step(when),
-                "expected": "Action completes without errors",
-                "type": "Action"
-            })
-            step_number += 1
-        
-        # Validations from Then
-        for then in then_steps:
-            test_steps.append({
-                "step_num": step_number,
-                "action": f"Verify: {then}",
-                "expected": then,
-                "type": "Validation"
-            })
-            step_number += 1
-        
-        # Add cleanup step
-        test_steps.append({
-            "step_num": step_number,
-            "action": "Clean up test data and restore initial state",
-            "expected": "System returns to original state",
-            "type": "Cleanup"
-        })
-        
-        # Format the test plan
-        content = f"""{'='*80}
+
+# Manual test plan sections. Separators are baked in at import time and the
+# remaining fields are filled with str.format_map.
+_PLAN_HEADER_TEMPLATE = f"""{_EQ80}
 MANUAL TEST PLAN
-{'='*80}
+{_EQ80}
 
-TICKET ID:           {ticket_key}
-TEST ID:             {ticket_key}_Test{test_number}
-TEST NUMBER:         {test_number} of {total_tests}
-TEST NAME:           {scenario_name}
-CREATED DATE:        {self._get_current_date()}
+TICKET ID:           {{ticket_key}}
+TEST ID:             {{ticket_key}}_Test{{test_number}}
+TEST NUMBER:         {{test_number}} of {{total_tests}}
+TEST NAME:           {{scenario_name}}
+CREATED DATE:        {{date}}
 TEST TYPE:           Functional Test
 PRIORITY:            High
 AUTOMATION:          Planned
 
-{'='*80}
+{_EQ80}
 TEST SUMMARY
-{'='*80}
-{summary}
+{_EQ80}
+{{summary}}
 
-{'='*80}
+{_EQ80}
 TEST OBJECTIVE
-{'='*80}
-{scenario_name}
+{_EQ80}
+{{scenario_name}}
 
-This test validates the functionality described in {ticket_key} ensuring that the
+This test validates the functionality described in {{ticket_key}} ensuring that the
 system behaves as expected according to the requirements and acceptance criteria.
 
-{'='*80}
+{_EQ80}
 REQUIREMENTS REFERENCE
-{'='*80}
+{_EQ80}
 Ticket Description:
-{self._format_description(description)}
+{{description}}
 
 """
-        
-        if discussion_summary:
-            content += f"""Additional Context from Discussions:
-{self._format_discussion_context(discussion_summary)}
+
+_PLAN_DISCUSSION_TEMPLATE = """Additional Context from Discussions:
+{discussion}
 
 """
-        
-        content += f"""{'='*80}
+
+_PLAN_PRECONDITIONS_HEADER = f"""{_EQ80}
 TEST PRECONDITIONS
-{'='*80}
+{_EQ80}
 """
-        
-        precondition_steps = [s for s in test_steps if s["type"] == "Precondition"]
-        if precondition_steps:
-            for step in precondition_steps:
-                content += f"{step['step_num']}. {step['action']}\n"
-        else:
-            content += "1. Application is accessible and running\n"
-            content += "2. Test user has appropriate access rights\n"
-            content += "3. Test environment is properly configured\n"
-        
-        content += f"""
-{'='*80}
+
+_PLAN_DEFAULT_PRECONDITIONS = """1. Application is accessible and running
+2. Test user has appropriate access rights
+3. Test environment is properly configured
+"""
+
+_PLAN_STEPS_HEADER = f"""
+{_EQ80}
 TEST STEPS
-{'='*80}
+{_EQ80}
 
 """
-        
-        # Write detailed test steps
-        for step in test_steps:
-            content += f"""Step {step['step_num']}: [{step['type']}]
-{'─'*80}
+
+_PLAN_STEP_TEMPLATE = f"""Step {{step_num}}: [{{type}}]
+{_DASH80}
 Action:
-  {step['action']}
+  {{action}}
 
 Expected Result:
-  {step['expected']}
+  {{expected}}
 
 Actual Result:
   [ TO BE FILLED DURING EXECUTION ]
 
 Status: [ PASS / FAIL / BLOCKED ]
 
-{'='*80}
+{_EQ80}
 
 """
-        
-        content += f"""{'='*80}
+
+_PLAN_TEST_DATA_HEADER = f"""{_EQ80}
 TEST DATA REQUIREMENTS
-{'='*80}
+{_EQ80}
 """
-        
-        # Extract test data from steps
-        test_data = self._extract_test_data_requirements(test_steps, description)
-        for data_item in test_data:
-            content += f"- {data_item}\n"
-        
-        content += f"""
-{'='*80}
+
+_PLAN_EXPECTED_RESULTS_HEADER = f"""
+{_EQ80}
 EXPECTED RESULTS SUMMARY
-{'='*80}
+{_EQ80}
 """
-        
-        validation_steps = [s for s in test_steps if s["type"] == "Validation"]
-        for idx, step in enumerate(validation_steps, 1):
-            content += f"{idx}. {step['expected']}\n"
-        
-        content += f"""
-{'='*80}
+
+_PLAN_FOOTER_TEMPLATE = f"""
+{_EQ80}
 PASS/FAIL CRITERIA
-{'='*80}
+{_EQ80}
 PASS: All test steps execute successfully and all expected results are observed
 FAIL: Any test step fails or expected result is not observed
 BLOCKED: Test cannot be executed due to environment or dependency issues
 
-{'='*80}
+{_EQ80}
 NOTES AND OBSERVATIONS
-{'='*80}
+{_EQ80}
 [ TO BE FILLED DURING EXECUTION ]
 
 Tester Name:     _____________________
@@ -735,212 +351,213 @@ Build/Version:   _____________________
 
 Final Status:    [ PASS / FAIL / BLOCKED ]
 
-{'='*80}
+{_EQ80}
 DEFECTS FOUND
-{'='*80}
+{_EQ80}
 Defect ID | Severity | Description | Status
-{'─'*80}
+{_DASH80}
 [ TO BE FILLED IF DEFECTS ARE FOUND ]
 
-{'='*80}
-END OF TEST PLAN - {ticket_key}_Test{test_number}
-{'='*80}
+{_EQ80}
+END OF TEST PLAN - {{ticket_key}}_Test{{test_number}}
+{_EQ80}
 """
-        
-        return content
-    
-    def _generate_additional_test_cases(
-        self, ticket_key: str, description: str, discussion_summary: str, starting_index: int
-    ) -> list[str]:
-        """Generate additional test cases for edge cases, negative scenarios, and boundary conditions."""
-        additional_tests = []
-        current_index = starting_index
-        
-        # Define comprehensive test scenarios for 100% coverage
-        additional_scenarios = [
-            {
-                "name": "Negative Test - Invalid Input Data",
-                "objective": "Verify system handles invalid input gracefully",
-                "steps": [
-                    {"action": "Prepare invalid test data (empty, null, special characters)", "expected": "Test data is prepared"},
-                    {"action": "Attempt to perform the operation with invalid data", "expected": "System rejects invalid input"},
-                    {"action": "Verify appropriate error message is displayed", "expected": "Clear error message explains the validation failure"},
-                    {"action": "Verify system state remains unchanged", "expected": "No data is corrupted or modified"},
-                ],
-                "type": "Negative"
-            },
-            {
-                "name": "Boundary Test - Minimum Values",
-                "objective": "Verify system behavior at minimum boundary conditions",
-                "steps": [
-                    {"action": "Identify minimum acceptable values from requirements", "expected": "Boundaries are documented"},
-                    {"action": "Test with minimum valid values", "expected": "Operation succeeds with minimum values"},
-                    {"action": "Test with values below minimum (if applicable)", "expected": "System rejects or handles appropriately"},
-                    {"action": "Verify data integrity at boundaries", "expected": "Data is stored and displayed correctly"},
-                ],
-                "type": "Boundary"
-            },
-            {
-                "name": "Boundary Test - Maximum Values",
-                "objective": "Verify system behavior at maximum boundary conditions",
-                "steps": [
-                    {"action": "Identify maximum acceptable values from requirements", "expected": "Boundaries are documented"},
-                    {"action": "Test with maximum valid values", "expected": "Operation succeeds with maximum values"},
-                    {"action": "Test with values above maximum (if applicable)", "expected": "System rejects or handles appropriately"},
-                    {"action": "Verify performance and response time", "expected": "System performs within acceptable limits"},
-                ],
-                "type": "Boundary"
-            },
-            {
-                "name": "Security Test - Access Control",
-                "objective": "Verify proper authorization and access controls",
-                "steps": [
-                    {"action": "Attempt operation with unauthorized user", "expected": "Access is denied"},
-                    {"action": "Verify appropriate error/permission message", "expected": "User receives clear permission denied message"},
-                    {"action": "Test with user having partial permissions", "expected": "Only authorized actions are allowed"},
-                    {"action": "Verify audit logs capture access attempts", "expected": "Security events are logged"},
-                ],
-                "type": "Security"
-            },
-            {
-                "name": "Performance Test - Response Time",
-                "objective": "Verify system performs within acceptable time limits",
-                "steps": [
-                    {"action": "Execute operation with normal data load", "expected": "Baseline performance is established"},
-                    {"action": "Measure response time for the operation", "expected": "Response time is within SLA requirements"},
-                    {"action": "Test with increased data volume", "expected": "Performance degrades gracefully"},
-                    {"action": "Verify no memory leaks or resource issues", "expected": "Resources are properly managed"},
-                ],
-                "type": "Performance"
-            },
-            {
-                "name": "Usability Test - User Experience",
-                "objective": "Verify user interface is intuitive and accessible",
-                "steps": [
-                    {"action": "Navigate to the feature using normal user flow", "expected": "Navigation is intuitive"},
-                    {"action": "Verify all UI elements are properly labeled", "expected": "Labels are clear and descriptive"},
-                    {"action": "Test keyboard navigation and accessibility", "expected": "Feature is keyboard accessible"},
-                    {"action": "Verify error messages are user-friendly", "expected": "Messages guide user to resolution"},
-                ],
-                "type": "Usability"
-            },
-            {
-                "name": "Integration Test - External Dependencies",
-                "objective": "Verify proper integration with dependent systems",
-                "steps": [
-                    {"action": "Identify external system dependencies", "expected": "Dependencies are documented"},
-                    {"action": "Test with all dependencies available", "expected": "Integration works correctly"},
-                    {"action": "Test with dependency unavailable/timeout", "expected": "System handles failures gracefully"},
-                    {"action": "Verify error handling and retry logic", "expected": "Appropriate error handling is in place"},
-                ],
-                "type": "Integration"
-            },
-            {
-                "name": "Data Validation Test - Input Constraints",
-                "objective": "Verify all input validations are properly enforced",
-                "steps": [
-                    {"action": "Test with required fields missing", "expected": "Validation errors are shown"},
-                    {"action": "Test with incorrect data types", "expected": "Type validation works correctly"},
-                    {"action": "Test with data exceeding length limits", "expected": "Length constraints are enforced"},
-                    {"action": "Test with SQL injection and XSS attempts", "expected": "Input sanitization prevents attacks"},
-                ],
-                "type": "Validation"
-            },
-        ]
-        
-        # Generate test plan for each additional scenario
-        for scenario in additional_scenarios:
-            test_content = self._create_additional_test_plan(
-                ticket_key=ticket_key,
-                test_number=current_index,
-                scenario=scenario,
-                description=description,
-                discussion_summary=discussion_summary
-            )
-            additional_tests.append(test_content)
-            current_index += 1
-        
-        return additional_tests
-    
-    def _create_additional_test_plan(
-        self, ticket_key: str, test_number: int, scenario: dict, description: str, discussion_summary: str
-    ) -> str:
-        """Create test plan for additional test scenarios."""
-        
-        content = f"""{'='*80}
-MANUAL TEST PLAN - {scenario['type'].upper()} TEST
-{'='*80}
-
-TICKET ID:           {ticket_key}
-TEST ID:             {ticket_key}_Test{test_number}
-TEST NUMBER:         {test_number}
-TEST NAME:           {scenario['name']}
-CREATED DATE:        {self._get_current_date()}
-TEST TYPE:           {scenario['type']} Test
-PRIORITY:            High
-AUTOMATION:          Planned
 
-{'='*80}
-TEST OBJECTIVE
-{'='*80}
-{scenario['objective']}
-
-This test ensures comprehensive coverage by validating {scenario['type'].lower()} scenarios
-that complement the functional requirements specified in {ticket_key}.
+# Test data listed first in every manual test plan; ticket-specific items
+# follow, up to _MAX_DATA_REQUIREMENTS entries in all
+_BASE_DATA_REQUIREMENTS = (
+    "Valid user credentials for test execution",
+    "Test environment access configuration",
+    "Sample data matching requirements specifications",
+)
+_DATA_KEYWORDS = (
+    "email", "username", "password", "name", "address", "phone", "date", "number", "id", "code"
+)
+_MAX_DATA_REQUIREMENTS = 10
+
+# Upper bound on threads used to write one ticket's manual test plans
+_PLAN_WRITE_WORKERS = 8
+
+# Additional scenarios generated for every ticket for 100% coverage
+_ADDITIONAL_SCENARIO_DATA: tuple[dict[str, Any], ...] = (
+    {
+        "name": "Negative Test - Invalid Input Data",
+        "objective": "Verify system handles invalid input gracefully",
+        "steps": (
+            {"action": "Prepare invalid test data (empty, null, special characters)", "expected": "Test data is prepared"},
+            {"action": "Attempt to perform the operation with invalid data", "expected": "System rejects invalid input"},
+            {"action": "Verify appropriate error message is displayed", "expected": "Clear error message explains the validation failure"},
+            {"action": "Verify system state remains unchanged", "expected": "No data is corrupted or modified"},
+        ),
+        "type": "Negative"
+    },
+    {
+        "name": "Boundary Test - Minimum Values",
+        "objective": "Verify system behavior at minimum boundary conditions",
+        "steps": (
+            {"action": "Identify minimum acceptable values from requirements", "expected": "Boundaries are documented"},
+            {"action": "Test with minimum valid values", "expected": "Operation succeeds with minimum values"},
+            {"action": "Test with values below minimum (if applicable)", "expected": "System rejects or handles appropriately"},
+            {"action": "Verify data integrity at boundaries", "expected": "Data is stored and displayed correctly"},
+        ),
+        "type": "Boundary"
+    },
+    {
+        "name": "Boundary Test - Maximum Values",
+        "objective": "Verify system behavior at maximum boundary conditions",
+        "steps": (
+            {"action": "Identify maximum acceptable values from requirements", "expected": "Boundaries are documented"},
+            {"action": "Test with maximum valid values", "expected": "Operation succeeds with maximum values"},
+            {"action": "Test with values above maximum (if applicable)", "expected": "System rejects or handles appropriately"},
+            {"action": "Verify performance and response time", "expected": "System performs within acceptable limits"},
+        ),
+        "type": "Boundary"
+    },
+    {
+        "name": "Security Test - Access Control",
+        "objective": "Verify proper authorization and access controls",
+        "steps": (
+            {"action": "Attempt operation with unauthorized user", "expected": "Access is denied"},
+            {"action": "Verify appropriate error/permission message", "expected": "User receives clear permission denied message"},
+            {"action": "Test with user having partial permissions", "expected": "Only authorized actions are allowed"},
+            {"action": "Verify audit logs capture access attempts", "expected": "Security events are logged"},
+        ),
+        "type": "Security"
+    },
+    {
+        "name": "Performance Test - Response Time",
+        "objective": "Verify system performs within acceptable time limits",
+        "steps": (
+            {"action": "Execute operation with normal data load", "expected": "Baseline performance is established"},
+            {"action": "Measure response time for the operation", "expected": "Response time is within SLA requirements"},
+            {"action": "Test with increased data volume", "expected": "Performance degrades gracefully"},
+            {"action": "Verify no memory leaks or resource issues", "expected": "Resources are properly managed"},
+        ),
+        "type": "Performance"
+    },
+    {
+        "name": "Usability Test - User Experience",
+        "objective": "Verify user interface is intuitive and accessible",
+        "steps": (
+            {"action": "Navigate to the feature using normal user flow", "expected": "Navigation is intuitive"},
+            {"action": "Verify all UI elements are properly labeled", "expected": "Labels are clear and descriptive"},
+            {"action": "Test keyboard navigation and accessibility", "expected": "Feature is keyboard accessible"},
+            {"action": "Verify error messages are user-friendly", "expected": "Messages guide user to resolution"},
+        ),
+        "type": "Usability"
+    },
+    {
+        "name": "Integration Test - External Dependencies",
+        "objective": "Verify proper integration with dependent systems",
+        "steps": (
+            {"action": "Identify external system dependencies", "expected": "Dependencies are documented"},
+            {"action": "Test with all dependencies available", "expected": "Integration works correctly"},
+            {"action": "Test with dependency unavailable/timeout", "expected": "System handles failures gracefully"},
+            {"action": "Verify error handling and retry logic", "expected": "Appropriate error handling is in place"},
+        ),
+        "type": "Integration"
+    },
+    {
+        "name": "Data Validation Test - Input Constraints",
+        "objective": "Verify all input validations are properly enforced",
+        "steps": (
+            {"action": "Test with required fields missing", "expected": "Validation errors are shown"},
+            {"action": "Test with incorrect data types", "expected": "Type validation works correctly"},
+            {"action": "Test with data exceeding length limits", "expected": "Length constraints are enforced"},
+            {"action": "Test with SQL injection and XSS attempts", "expected": "Input sanitization prevents attacks"},
+        ),
+        "type": "Validation"
+    },
+)
 
-{'='*80}
-REQUIREMENTS REFERENCE
-{'='*80}
-Based on ticket: {ticket_key}
 
-{self._format_description(description)}
+def _escape_format(text: str) -> str:
+    """Escape braces so ``text`` survives a later str.format_map pass."""
+    return text.replace("{", "{{").replace("}", "}}")
 
-{'='*80}
-TEST PRECONDITIONS
-{'='*80}
-1. All functional tests for {ticket_key} have been reviewed
-2. Test environment is stable and accessible
-3. Test data is prepared according to test type requirements
-4. Required user accounts and permissions are configured
 
-{'='*80}
-TEST STEPS
-{'='*80}
+def _compile_additional_plan_template(scenario: Mapping[str, Any]) -> str:
+    """Render the ticket-independent text of an additional test plan.
 
-"""
-        
-        for idx, step in enumerate(scenario['steps'], 1):
-            content += f"""Step {idx}:
-{'─'*80}
+    Everything that depends only on the scenario is filled in here, once at
+    import. The result is a format_map template that still takes
+    ``ticket_key``, ``test_number``, ``date`` and ``description``.
+    """
+    scenario_type = _escape_format(scenario["type"])
+    scenario_type_lower = scenario_type.lower()
+    steps_block = "".join(
+        f"""Step {idx}:
+{_DASH80}
 Action:
-  {step['action']}
+  {_escape_format(step["action"])}
 
 Expected Result:
-  {step['expected']}
+  {_escape_format(step["expected"])}
 
 Actual Result:
   [ TO BE FILLED DURING EXECUTION ]
 
 Status: [ PASS / FAIL / BLOCKED ]
 
-{'='*80}
+{_EQ80}
 
 """
-        
-        content += f"""{'='*80}
+        for idx, step in enumerate(scenario["steps"], 1)
+    )
+    return f"""{_EQ80}
+MANUAL TEST PLAN - {scenario_type.upper()} TEST
+{_EQ80}
+
+TICKET ID:           {{ticket_key}}
+TEST ID:             {{ticket_key}}_Test{{test_number}}
+TEST NUMBER:         {{test_number}}
+TEST NAME:           {_escape_format(scenario["name"])}
+CREATED DATE:        {{date}}
+TEST TYPE:           {scenario_type} Test
+PRIORITY:            High
+AUTOMATION:          Planned
+
+{_EQ80}
+TEST OBJECTIVE
+{_EQ80}
+{_escape_format(scenario["objective"])}
+
+This test ensures comprehensive coverage by validating {scenario_type_lower} scenarios
+that complement the functional requirements specified in {{ticket_key}}.
+
+{_EQ80}
+REQUIREMENTS REFERENCE
+{_EQ80}
+Based on ticket: {{ticket_key}}
+
+{{description}}
+
+{_EQ80}
+TEST PRECONDITIONS
+{_EQ80}
+1. All functional tests for {{ticket_key}} have been reviewed
+2. Test environment is stable and accessible
+3. Test data is prepared according to test type requirements
+4. Required user accounts and permissions are configured
+
+{_EQ80}
+TEST STEPS
+{_EQ80}
+
+{steps_block}{_EQ80}
 PASS/FAIL CRITERIA
-{'='*80}
-PASS: All validation points pass and system behaves according to {scenario['type'].lower()} test requirements
+{_EQ80}
+PASS: All validation points pass and system behaves according to {scenario_type_lower} test requirements
 FAIL: Any expected behavior is not observed or system behaves incorrectly
 BLOCKED: Test cannot be completed due to dependencies or environment issues
 
-{'='*80}
+{_EQ80}
 NOTES AND OBSERVATIONS
-{'='*80}
+{_EQ80}
 [ TO BE FILLED DURING EXECUTION ]
 
-This {scenario['type'].lower()} test is critical for ensuring 100% test coverage and
-should be executed as part of the comprehensive test suite for {ticket_key}.
+This {scenario_type_lower} test is critical for ensuring 100% test coverage and
+should be executed as part of the comprehensive test suite for {{ticket_key}}.
 
 Tester Name:     _____________________
 Test Date:       _____________________
@@ -949,12 +566,641 @@ Build/Version:   _____________________
 
 Final Status:    [ PASS / FAIL / BLOCKED ]
 
-{'='*80}
-END OF TEST PLAN - {ticket_key}_Test{test_number}
-{'='*80}
+{_EQ80}
+END OF TEST PLAN - {{ticket_key}}_Test{{test_number}}
+{_EQ80}
 """
+
+
+def _split_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a format_map template into (literal, field name) segments.
+
+    Joining the segments with their field values gives the same text as
+    ``template.format_map(values)`` without re-parsing the template.
+    """
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in Formatter().parse(template)
+    )
+
+
+# Read-only views of the scenarios above; they are shared by every ticket,
+# so nothing downstream may mutate them. Each carries its precompiled plan
+# under "plan_segments".
+_ADDITIONAL_SCENARIOS = tuple(
+    MappingProxyType(
+        {
+            **scenario,
+            "steps": tuple(MappingProxyType(step) for step in scenario["steps"]),
+            "plan_segments": _split_template(_compile_additional_plan_template(scenario)),
+        }
+    )
+    for scenario in _ADDITIONAL_SCENARIO_DATA
+)
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase ``text`` for literal keyword prefilters.
+
+    ASCII keywords found in the result are exactly those an IGNORECASE
+    pattern would find in ``text``, so a prefilter built on it never rejects
+    text the full pattern matches.
+    """
+    if not text.isascii():
+        for char, ascii_char in _IGNORECASE_ALIASES:
+            if char in text:
+                text = text.replace(char, ascii_char)
+    return text.lower()
+
+
+def _iter_gwt_steps(text: str) -> Iterator[tuple[str, str, str]]:
+    """Yield (given, when, then) step texts found in order in ``text``.
+
+    Each keyword is located with a plain forward search and its step runs to
+    the end of that line, so matching stays linear in the length of the text.
+    """
+    # Most descriptions have no Gherkin at all; plain substring checks on the
+    # folded text rule that out before any regex runs.
+    folded = _fold_case(text)
+    if not all(keyword in folded for keyword in _GWT_KEYWORDS):
+        return
+
+    pos = 0
+    length = len(text)
+    while True:
+        steps = []
+        for keyword_re in _GWT_KEYWORD_RES:
+            match = keyword_re.search(text, pos)
+            if not match:
+                return
+            line_end = text.find("\n", match.end())
+            if line_end == -1:
+                line_end = length
+            steps.append(text[match.end():line_end])
+            pos = line_end + 1
+        given, when, then = steps
+        yield given, when, then
+
+
+@lru_cache(maxsize=4)
+def _format_date(ordinal: int) -> str:
+    """Format a proleptic Gregorian ordinal as e.g. "January 05, 2025"."""
+    return date.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
+def _write_plan_file(
+    file_path: Path, write_plan: Callable[[Callable[[str], object]], None]
+) -> str:
+    """Stream one plan straight to disk through the file buffer."""
+    with open(file_path, "w", encoding="utf-8", buffering=65536) as fh:
+        write_plan(fh.write)
+    return str(file_path)
+
+
+@dataclass(slots=True)
+class TestScenario:
+    """Represents a test scenario with Given-When-Then steps."""
+
+    scenario: str
+    given: list[str]
+    when: list[str]
+    then: list[str]
+
+
+@dataclass(frozen=True, slots=True)
+class TicketContext:
+    """Ticket text prepared once and shared by all of a ticket's test plans.
+
+    ``formatted_discussion`` is empty when the ticket has no discussions.
+    """
+
+    description_lower: str
+    formatted_description: str
+    formatted_discussion: str
+
+
+class TestGeneratorService:
+    """Service for generating test automation scripts."""
+
+    def __init__(self):
+        self.output_dir = os.getenv("OUTPUT_DIRECTORY", "./generated-tests")
+
+    async def analyze_requirements(self, ticket: dict[str, Any]) -> dict[str, Any]:
+        """Analyze ticket requirements and extract test scenarios."""
+        fields = ticket.get("fields", {})
+        description = fields.get("description", "")
+        summary = fields.get("summary", "")
+        discussion_summary = ticket.get("discussion_summary", "")
+
+        scenarios = self._extract_test_scenarios(description, summary, discussion_summary)
+        complexity = self._calculate_complexity(scenarios, description)
+
+        return {
+            "ticket_key": ticket["key"],
+            "summary": summary,
+            "discussion_summary": discussion_summary,
+            "test_scenarios": [
+                {
+                    "scenario": s.scenario,
+                    "given": s.given,
+                    "when": s.when,
+                    "then": s.then,
+                }
+                for s in scenarios
+            ],
+            "estimated_test_count": len(scenarios),
+            "complexity": complexity,
+        }
+
+    async def generate_tests(
+        self,
+        ticket: dict[str, Any],
+        language: Literal["java", "python"] = "java",
+        output_path: str | None = None,
+    ) -> dict[str, Any]:
+        """Generate complete test automation suite."""
+        analysis = await self.analyze_requirements(ticket)
+        ticket_key = ticket["key"]
+        output_directory = Path(output_path or self.output_dir) / ticket_key
+        output_directory.mkdir(parents=True, exist_ok=True)
+
+        # Files to write, as (path, content) pairs
+        pending: list[tuple[Path, str]] = []
+
+        # Generate Gherkin feature file
+        pending.append(
+            (output_directory / f"{ticket_key}.feature", self._generate_feature_file(analysis))
+        )
+
+        # Generate language-specific files
+        if language == "java":
+            pending.extend(self._generate_java_tests(analysis, output_directory))
+        else:
+            pending.extend(self._generate_python_tests(analysis, output_directory))
+
+        # Generate TestNG XML
+        pending.append((output_directory / "testng.xml", self._generate_testng_xml(analysis)))
+
+        # Generate README
+        pending.append(
+            (output_directory / "README.md", self._generate_readme(analysis, language))
+        )
+
+        # Generate manual test plans
+        pending.extend(self._build_manual_test_plans(ticket, analysis, output_directory))
+
+        generated_files = await self._write_files(pending)
+
+        return {
+            "success": True,
+            "files": generated_files,
+            "message": f"Generated {len(generated_files)} files for {ticket_key}",
+        }
+
+    async def _write_files(self, pending: list[tuple[Path, str]]) -> list[str]:
+        """Write generated files concurrently off the event loop."""
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(path.write_text, content, encoding="utf-8")
+                for path, content in pending
+            )
+        )
+        return [str(path) for path, _ in pending]
+
+    async def generate_gherkin_features(
+        self, ticket: dict[str, Any], output_path: str | None = None
+    ) -> dict[str, Any]:
+        """Generate Gherkin feature files only."""
+        analysis = await self.analyze_requirements(ticket)
+        feature_content = self._generate_feature_file(analysis)
+        ticket_key = ticket["key"]
+
+        if output_path:
+            feature_path = Path(output_path) / f"{ticket_key}.feature"
+            feature_path.parent.mkdir(parents=True, exist_ok=True)
+            feature_path.write_text(feature_content, encoding="utf-8")
+            return {
+                "success": True,
+                "file": str(feature_path),
+                "content": feature_content,
+            }
+
+        return {
+            "success": True,
+            "file": f"{ticket_key}.feature",
+            "content": feature_content,
+        }
+
+    def _extract_test_scenarios(
+        self, description: str, summary: str, discussion_summary: str = ""
+    ) -> list[TestScenario]:
+        """Extract test scenarios from description and discussions."""
+        scenarios = []
         
-        return content
+        # Combine description and discussion for comprehensive analysis
+        combined_text = f"{description}\n\n{discussion_summary}"
+
+        for given, when, then in _iter_gwt_steps(combined_text):
+            scenarios.append(
+                TestScenario(
+                    scenario=f"Scenario: {summary}",
+                    given=[given.strip()],
+                    when=[when.strip()],
+                    then=[then.strip()],
+                )
+            )
+
+        # Extract additional scenarios from discussions
+        if discussion_summary:
+            discussion_scenarios = self._extract_scenarios_from_discussions(discussion_summary, summary)
+            scenarios.extend(discussion_scenarios)
+
+        # Fallback: Create basic scenario
+        if not scenarios:
+            scenarios.append(
+                TestScenario(
+                    scenario=f"Test {summary}",
+                    given=list(_DEFAULT_GIVEN),
+                    when=["User performs the action described in ticket"],
+                    then=["Expected behavior occurs as per ticket description"],
+                )
+            )
+
+        return scenarios
+    
+    def _extract_scenarios_from_discussions(
+        self, discussion_summary: str, summary: str
+    ) -> list[TestScenario]:
+        """Extract additional test scenarios from discussion comments."""
+        scenarios: list[TestScenario] = []
+
+        # Skip the regexes when none of their keywords occur in the text
+        folded = _fold_case(discussion_summary)
+        if not any(literal in folded for literal in _DISCUSSION_LITERALS):
+            return scenarios
+        
+        seen: set[str] = set()
+        for pattern in _DISCUSSION_RES:
+            for match in pattern.finditer(discussion_summary):
+                scenario_text = match.group(1).strip()
+                if scenario_text and len(scenario_text) > 10:
+                    # Skip discussion points that would produce the same scenario
+                    key = scenario_text[:150]
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                    # Create a scenario from the discussion point
+                    scenarios.append(
+                        TestScenario(
+                            scenario=f"Scenario from discussion: {scenario_text[:100]}",
+                            given=list(_DEFAULT_GIVEN),
+                            when=[f"User performs: {key}"],
+                            then=list(_DISCUSSION_THEN),
+                        )
+                    )
+        
+        return scenarios
+
+    def _calculate_complexity(
+        self, scenarios: list[TestScenario], description: str
+    ) -> Literal["low", "medium", "high"]:
+        """Calculate test complexity."""
+        scenario_count, desc_length = len(scenarios), len(description)
+        return (
+            "low" if scenario_count <= 2 and desc_length < 500
+            else "medium" if scenario_count <= 5 and desc_length < 1500
+            else "high"
+        )
+
+    def _generate_feature_file(self, analysis: dict[str, Any]) -> str:
+        """Generate Gherkin feature file content."""
+        return "\n".join(self._iter_feature_lines(analysis))
+
+    def _iter_feature_lines(self, analysis: dict[str, Any]) -> Iterator[str]:
+        """Yield the lines of the Gherkin feature file."""
+        yield f"Feature: {analysis['summary']}"
+        yield "  As a tester"
+        yield f"  I want to test {analysis['ticket_key']}"
+        yield "  So that the functionality works as expected"
+        yield ""
+
+        # Add discussion context if available
+        if analysis.get("discussion_summary"):
+            yield "  # Additional context from discussions:"
+            # Only the first 3 discussion points are used, so stop splitting there
+            discussion_lines = analysis["discussion_summary"].split("\n\n", 3)
+            for disc_line in discussion_lines[:3]:
+                if disc_line.strip():
+                    yield f"  # {disc_line.strip()[:100]}"
+            yield ""
+
+        for i, scenario in enumerate(analysis["test_scenarios"]):
+            if i:
+                yield ""
+            yield f"  Scenario: {scenario['scenario']}"
+            for step in scenario["given"]:
+                yield f"    Given {step}"
+            for step in scenario["when"]:
+                yield f"    When {step}"
+            for step in scenario["then"]:
+                yield f"    Then {step}"
+
+    def _generate_java_tests(
+        self, analysis: dict[str, Any], output_dir: Path
+    ) -> list[tuple[Path, str]]:
+        """Generate Java test files as (path, content) pairs."""
+        files = []
+        ticket_key = analysis["ticket_key"]
+        class_name = ticket_key.replace("-", "_")
+
+        # Step definitions
+        step_defs = _JAVA_STEP_DEFS_TEMPLATE.format_map({"class_name": class_name})
+        files.append((output_dir / "StepDefinitions.java", step_defs))
+
+        # Test runner
+        runner = _JAVA_TEST_RUNNER_TEMPLATE.format_map(
+            {"ticket_key": ticket_key, "class_name": class_name}
+        )
+        files.append((output_dir / "TestRunner.java", runner))
+
+        # POM XML
+        pom = _POM_TEMPLATE.format_map({"artifact_id": ticket_key.lower()})
+        files.append((output_dir / "pom.xml", pom))
+
+        return files
+
+    def _generate_python_tests(
+        self, analysis: dict[str, Any], output_dir: Path
+    ) -> list[tuple[Path, str]]:
+        """Generate Python test files as (path, content) pairs."""
+        return [
+            # Step definitions
+            (output_dir / "step_definitions.py", _PYTHON_STEP_DEFS),
+            # Requirements
+            (output_dir / "requirements.txt", _PYTHON_REQUIREMENTS),
+        ]
+
+    def _generate_testng_xml(self, analysis: dict[str, Any]) -> str:
+        """Generate TestNG XML configuration."""
+        ticket_key = analysis["ticket_key"]
+        class_name = ticket_key.replace("-", "_")
+        return _TESTNG_TEMPLATE.format_map({"ticket_key": ticket_key, "class_name": class_name})
+
+    def _generate_readme(self, analysis: dict[str, Any], language: str) -> str:
+        """Generate README documentation."""
+        scenarios_text = "\n\n".join(
+            f'''### {i+1}. {s["scenario"]}
+- **Given**: {", ".join(s["given"])}
+- **When**: {", ".join(s["when"])}
+- **Then**: {", ".join(s["then"])}'''
+            for i, s in enumerate(analysis["test_scenarios"])
+        )
+
+        setup_instructions = (
+            """1. Install Java JDK 11 or higher
+2. Install Maven
+3. Run: `mvn clean install`
+4. Execute tests: `mvn test`"""
+            if language == "java"
+            else """1. Install Python 3.8 or higher
+2. Install dependencies: `pip install -r requirements.txt`
+3. Run tests: `behave`"""
+        )
+
+        return _README_TEMPLATE.format_map(
+            {
+                "ticket_key": analysis["ticket_key"],
+                "summary": analysis["summary"],
+                "estimated_test_count": analysis["estimated_test_count"],
+                "complexity": analysis["complexity"],
+                "language": language,
+                "language_title": language.title(),
+                "setup_instructions": setup_instructions,
+                "scenarios_text": scenarios_text,
+            }
+        )
+
+    def _generate_manual_test_plans(
+        self, ticket: dict[str, Any], analysis: dict[str, Any], output_dir: Path
+    ) -> list[str]:
+        """Generate detailed manual test plan files with 100% coverage."""
+        plans = list(self._iter_manual_test_plans(ticket, analysis, output_dir))
+        # Plans are independent, so render and write them on a small pool
+        with ThreadPoolExecutor(max_workers=min(_PLAN_WRITE_WORKERS, len(plans))) as executor:
+            return list(executor.map(_write_plan_file, *zip(*plans)))
+
+    def _build_manual_test_plans(
+        self, ticket: dict[str, Any], analysis: dict[str, Any], output_dir: Path
+    ) -> list[tuple[Path, str]]:
+        """Build manual test plan files as (path, content) pairs."""
+        plans = []
+        for file_path, write_plan in self._iter_manual_test_plans(ticket, analysis, output_dir):
+            parts: list[str] = []
+            write_plan(parts.append)
+            plans.append((file_path, "".join(parts)))
+        return plans
+
+    def _iter_manual_test_plans(
+        self, ticket: dict[str, Any], analysis: dict[str, Any], output_dir: Path
+    ) -> Iterator[tuple[Path, Callable[[Callable[[str], object]], None]]]:
+        """Yield (path, writer) pairs; each writer emits one plan through ``write``."""
+        ticket_key = analysis["ticket_key"]
+        fields = ticket.get("fields", {})
+        
+        # Extract all relevant information
+        description = fields.get("description", "")
+        summary = analysis.get("summary", "")
+        discussion_summary = analysis.get("discussion_summary", "")
+        test_scenarios = analysis.get("test_scenarios", [])
+
+        # The ticket text is the same in every plan, so prepare it only once
+        context = TicketContext(
+            description_lower=description.lower() if description else "",
+            formatted_description=self._format_description(description),
+            formatted_discussion=(
+                self._format_discussion_context(discussion_summary) if discussion_summary else ""
+            ),
+        )
+        
+        # Generate test plans for each scenario
+        for idx, scenario in enumerate(test_scenarios, start=1):
+            # Create filename: <JIRA_ID>_Test<number>.txt
+            filename = f"{ticket_key}_Test{idx}.txt"
+            yield output_dir / filename, partial(
+                self._write_manual_test_plan,
+                ticket_key=ticket_key,
+                test_number=idx,
+                scenario=scenario,
+                summary=summary,
+                context=context,
+                total_tests=len(test_scenarios)
+            )
+        
+        # Generate additional edge case and negative test plans
+        additional_tests = self._generate_additional_test_cases(
+            ticket_key=ticket_key,
+            formatted_description=context.formatted_description,
+            starting_index=len(test_scenarios) + 1
+        )
+        
+        for idx, write_plan in enumerate(additional_tests, start=len(test_scenarios) + 1):
+            filename = f"{ticket_key}_Test{idx}.txt"
+            yield output_dir / filename, write_plan
+    
+    def _write_manual_test_plan(
+        self,
+        write: Callable[[str], object],
+        ticket_key: str,
+        test_number: int,
+        scenario: dict[str, Any],
+        summary: str,
+        context: TicketContext,
+        total_tests: int
+    ) -> None:
+        """Write a detailed manual test plan document section by section."""
+        
+        # Extract scenario details
+        scenario_name = scenario.get("scenario", "Test Scenario")
+        given_steps = scenario.get("given", [])
+        when_steps = scenario.get("when", [])
+        then_steps = scenario.get("then", [])
+        
+        # Build test steps, partitioned by type as they are created
+        test_steps = []
+        precondition_steps = []
+        validation_steps = []
+        step_number = 1
+        
+        # Preconditions from Given
+        for given in given_steps:
+            step = {
+                "step_num": step_number,
+                "action": f"Verify precondition: {given}",
+                "expected": "Precondition is met and ready for testing",
+                "type": "Precondition"
+            }
+            test_steps.append(step)
+            precondition_steps.append(step)
+            step_number += 1
+        
+        # Actions from When
+        for when in when_steps:
+            test_steps.append({
+                "step_num": step_number,
+                "action": self._expand_action_step(when),
+                "expected": "Action completes without errors",
+                "type": "Action"
+            })
+            step_number += 1
+        
+        # Validations from Then
+        for then in then_steps:
+            step = {
+                "step_num": step_number,
+                "action": f"Verify: {then}",
+                "expected": then,
+                "type": "Validation"
+            }
+            test_steps.append(step)
+            validation_steps.append(step)
+            step_number += 1
+        
+        # Add cleanup step
+        test_steps.append({
+            "step_num": step_number,
+            "action": "Clean up test data and restore initial state",
+            "expected": "System returns to original state",
+            "type": "Cleanup"
+        })
+        
+        # Format the test plan
+        write(
+            _PLAN_HEADER_TEMPLATE.format_map(
+                {
+                    "ticket_key": ticket_key,
+                    "test_number": test_number,
+                    "total_tests": total_tests,
+                    "scenario_name": scenario_name,
+                    "date": self._get_current_date(),
+                    "summary": summary,
+                    "description": context.formatted_description,
+                }
+            )
+        )
+        
+        if context.formatted_discussion:
+            write(
+                _PLAN_DISCUSSION_TEMPLATE.format_map({"discussion": context.formatted_discussion})
+            )
+        
+        write(_PLAN_PRECONDITIONS_HEADER)
+        if precondition_steps:
+            for step in precondition_steps:
+                write(f"{step['step_num']}. {step['action']}\n")
+        else:
+            write(_PLAN_DEFAULT_PRECONDITIONS)
+        
+        # Write detailed test steps
+        write(_PLAN_STEPS_HEADER)
+        for step in test_steps:
+            write(_PLAN_STEP_TEMPLATE.format_map(step))
+        
+        # Extract test data from steps
+        write(_PLAN_TEST_DATA_HEADER)
+        test_data = self._extract_test_data_requirements(test_steps, context.description_lower)
+        for data_item in test_data:
+            write(f"- {data_item}\n")
+        
+        write(_PLAN_EXPECTED_RESULTS_HEADER)
+        for idx, step in enumerate(validation_steps, 1):
+            write(f"{idx}. {step['expected']}\n")
+        
+        write(
+            _PLAN_FOOTER_TEMPLATE.format_map(
+                {"ticket_key": ticket_key, "test_number": test_number}
+            )
+        )
+    
+    def _generate_additional_test_cases(
+        self, ticket_key: str, formatted_description: str, starting_index: int
+    ) -> Iterator[Callable[[Callable[[str], object]], None]]:
+        """Yield writers for additional edge case, negative and boundary test plans.
+
+        Each writer renders its plan only when called, straight into ``write``.
+        """
+        current_index = starting_index
+        
+        # Generate test plan for each additional scenario
+        for scenario in _ADDITIONAL_SCENARIOS:
+            yield partial(
+                self._write_additional_test_plan,
+                ticket_key=ticket_key,
+                test_number=current_index,
+                scenario=scenario,
+                formatted_description=formatted_description
+            )
+            current_index += 1
+    
+    def _write_additional_test_plan(
+        self,
+        write: Callable[[str], object],
+        ticket_key: str,
+        test_number: int,
+        scenario: Mapping[str, Any],
+        formatted_description: str
+    ) -> None:
+        """Write test plan for additional test scenarios."""
+        values = {
+            "ticket_key": ticket_key,
+            "test_number": str(test_number),
+            "date": self._get_current_date(),
+            "description": formatted_description,
+        }
+        for literal, field_name in scenario["plan_segments"]:
+            write(literal)
+            if field_name:
+                write(values[field_name])
     
     def _expand_action_step(self, action: str) -> str:
         """Expand action step with more detailed instructions."""
@@ -967,8 +1213,10 @@ END OF TEST PLAN - {ticket_key}_Test{test_number}
         if not description:
             return "No detailed description available. Refer to ticket summary."
         
-        # Limit length and format
-        formatted = description.replace("\r\n", "\n").strip()
+        # Limit length and format; most descriptions have no CR to normalize
+        if "\r" in description:
+            description = description.replace("\r\n", "\n")
+        formatted = description.strip()
         if len(formatted) > 500:
             formatted = formatted[:500] + "...\n[See full description in JIRA ticket]"
         
@@ -980,41 +1228,35 @@ END OF TEST PLAN - {ticket_key}_Test{test_number}
             return "No additional discussions available."
         
         # Limit and format discussion points
-        discussions = discussion_summary.split("\n\n")
-        formatted_discussions = []
-        
-        for disc in discussions[:5]:  # Limit to top 5 discussions
-            if disc.strip():
-                formatted_discussions.append(f"  - {disc.strip()}")
-        
-        return "\n".join(formatted_discussions) if formatted_discussions else "No significant discussion points."
+        # Only the top 5 discussions are used, so stop splitting there
+        discussions = discussion_summary.split("\n\n", 5)
+        return "\n".join(
+            [f"  - {disc}" for raw in discussions[:5] if (disc := raw.strip())]
+        ) or "No significant discussion points."
     
-    def _extract_test_data_requirements(self, test_steps: list[dict], description: str) -> list[str]:
-        """Extract test data requirements from steps and description."""
-        data_requirements = [
-            "Valid user credentials for test execution",
-            "Test environment access configuration",
-            "Sample data matching requirements specifications",
-        ]
+    def _extract_test_data_requirements(
+        self, test_steps: list[dict], description_lower: str
+    ) -> list[str]:
+        """Extract test data requirements from steps and the lowercased description."""
+        # Requirements beyond the base ones, in first-seen order; a dict keeps
+        # them unique without losing that order
+        extras: dict[str, None] = {}
         
         # Look for data mentions in description
-        data_keywords = ["email", "username", "password", "name", "address", "phone", "date", "number", "id", "code"]
-        description_lower = description.lower() if description else ""
-        
-        for keyword in data_keywords:
+        for keyword in _DATA_KEYWORDS:
             if keyword in description_lower:
-                data_requirements.append(f"Valid test {keyword} data")
+                extras[f"Valid test {keyword} data"] = None
         
         # Check steps for data requirements
         for step in test_steps:
-            action_lower = step['action'].lower()
+            action = step['action']
+            action_lower = action.lower()
             if "data" in action_lower or "value" in action_lower or "input" in action_lower:
-                data_requirements.append(f"Data for: {step['action'][:60]}")
+                extras[f"Data for: {action[:60]}"] = None
         
-        return list(set(data_requirements))[:10]  # Remove duplicates and limit
+        return [*_BASE_DATA_REQUIREMENTS, *extras][:_MAX_DATA_REQUIREMENTS]
     
     def _get_current_date(self) -> str:
         """Get current date in readable format."""
-        from datetime import datetime
-        return datetime.now().strftime("%B %d, %Y")
+        return _format_date(date.today().toordinal())
 